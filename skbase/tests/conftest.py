@@ -145,6 +145,7 @@ SKBASE_CLASSES_BY_MODULE.update(
             "_BaseObjectPrettyPrinter",
         ),
         "skbase.base._tagmanager": ("_FlagManager",),
+        "skbase.utils.stdout_mute": ("StdoutMute", "_NullSink", "_StreamMute"),
     }
 )
 SKBASE_PUBLIC_FUNCTIONS_BY_MODULE = {
@@ -240,18 +241,24 @@ SKBASE_FUNCTIONS_BY_MODULE.update(
         "skbase.utils._nested_iter": (
             "flatten",
             "is_flat",
+            "_is_nested",
             "_remove_single",
             "unflat_len",
             "unflatten",
+            "_unflatten",
         ),
         "skbase.utils._utils": ("subset_dict_keys",),
         "skbase.utils.deep_equals": ("deep_equals",),
-        "skbase.utils.deep_equals._common": ("_make_ret", "_ret"),
+        "skbase.utils.deep_equals._common": (
+            "_make_ret",
+            "_ret",
+            "_ret_is_equal",
+            "_ret_with_msg",
+        ),
         "skbase.utils.deep_equals._deep_equals": (
             "_coerce_list",
             "_dict_equals",
             "_fh_equals_plugin",
-            "_is_npnan",
             "_is_npndarray",
             "_is_pandas",
             "_numpy_equals_plugin",
@@ -263,6 +270,7 @@ SKBASE_FUNCTIONS_BY_MODULE.update(
             "_tuple_equals",
             "deep_equals",
             "deep_equals_custom",
+            "_deep_equals_custom",
         ),
         "skbase.utils.dependencies._dependencies": (
             "_check_soft_dependencies",
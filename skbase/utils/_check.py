@@ -50,4 +50,11 @@ def _is_scalar_nan(x: Any) -> bool:
     >>> _is_scalar_nan([np.nan])
     False
     """
+    # common exact types are decided before the comparatively expensive
+    # abstract base class check, x is never compared to avoid elementwise work
+    type_x = type(x)
+    if type_x is float:
+        return math.isnan(x)
+    if type_x in (int, bool, str, type(None)):
+        return False
     return isinstance(x, numbers.Real) and math.isnan(x)
@@ -2,11 +2,9 @@
 # -*- coding: utf-8 -*-
 # copyright: skbase developers, BSD-3-Clause License (see LICENSE file)
 """Functionality for working with sequences."""
-import collections
-import re
 from collections.abc import Sequence
 
-from skbase.utils._nested_iter import _remove_single, flatten, is_flat, unflatten
+from skbase.utils._nested_iter import flatten, is_flat, unflatten
 
 __author__ = ["fkiraly", "RNKuhns"]
 __all__ = [
@@ -16,6 +14,10 @@ __all__ = [
     "make_strings_unique",
 ]
 
+# prefix and suffix of printed types, e.g., "<class 'int'>"
+_CLS_PREFIX = "<class '"
+_CLS_SUFFIX = "'>"
+
 
 def _scalar_to_seq(scalar, sequence_type=None):
     """Convert a scalar input to a sequence.
@@ -57,8 +59,16 @@ def _scalar_to_seq(scalar, sequence_type=None):
     >>> _scalar_to_seq((1, 2))
     (1, 2)
     """
+    type_scalar = type(scalar)
+    if type_scalar is tuple or type_scalar is list:
+        return scalar
     # We'll treat str like regular scalar and not a sequence
-    if isinstance(scalar, Sequence) and not isinstance(scalar, str):
+    # common scalars skip the check against the Sequence abstract base class
+    elif (
+        type_scalar not in (str, int, float, bool)
+        and isinstance(scalar, Sequence)
+        and not isinstance(scalar, str)
+    ):
         return scalar
     elif sequence_type is None:
         return (scalar,)
@@ -76,9 +86,13 @@ def _remove_type_text(input_):
     if not isinstance(input_, str):
         input_ = str(input_)
 
-    m = re.match("^<class '(.*)'>$", input_)
-    if m:
-        return m[1]
+    # fixed prefix and suffix checks avoid the overhead of a regex match
+    if (
+        len(input_) >= len(_CLS_PREFIX) + len(_CLS_SUFFIX)
+        and input_.startswith(_CLS_PREFIX)
+        and input_.endswith(_CLS_SUFFIX)
+    ):
+        return input_[len(_CLS_PREFIX) : -len(_CLS_SUFFIX)]
     else:
         return input_
 
@@ -140,18 +154,20 @@ def _format_seq_to_str(seq, sep=", ", last_sep=None, remove_type_text=True):
             "`seq` must be a sequence or scalar str, int, float, bool or class."
         )
 
-    seq_str = [str(e) for e in seq]
     if remove_type_text:
-        seq_str = [_remove_type_text(s) for s in seq_str]
+        seq_str = [_remove_type_text(e) for e in seq]
+    else:
+        seq_str = [str(e) for e in seq]
 
     if last_sep is None:
         output_str = sep.join(seq_str)
     else:
         if len(seq_str) == 1:
-            output_str = _remove_single(seq_str)
+            output_str = seq_str[0]
         else:
-            output_str = sep.join(e for e in seq_str[:-1])
-            output_str = output_str + f" {last_sep} " + seq_str[-1]
+            # for two elements, no join (and no slice) is needed for the head
+            head = sep.join(seq_str[:-1]) if len(seq_str) > 2 else seq_str[0]
+            output_str = f"{head} {last_sep} {seq_str[-1]}"
 
     return output_str
 
@@ -195,25 +211,29 @@ def make_strings_unique(str_list):
         unique_strs = unflatten(unique_flat_str_list, str_list)
         return unique_strs
 
+    # if already unique, just return
+    if len(set(str_list)) == len(str_list):
+        return str_list
+
     # if strlist is a tuple, convert to list, apply this function, then convert back
     if isinstance(str_list, tuple):
         unique_strs = make_strings_unique(list(str_list))
         unique_strs = tuple(unique_strs)
         return unique_strs
 
-    # now we can assume that strlist is a flat list
-    # if already unique, just return
-    if len(set(str_list)) == len(str_list):
-        return str_list
-
-    str_count = collections.Counter(str_list)
+    # now we can assume that strlist is a flat list with duplicates
+    str_count = {}
+    for x in str_list:
+        str_count[x] = str_count.get(x, 0) + 1
     # if any duplicates, we append _integer of occurrence to non-uniques
-    now_count: collections.Counter = collections.Counter()
-    unique_strs = str_list
+    # we copy str_list here to avoid mutating the input list in place
+    now_count = {}
+    unique_strs = list(str_list)
     for i, x in enumerate(unique_strs):
         if str_count[x] > 1:
-            now_count.update([x])
-            unique_strs[i] = x + "_" + str(now_count[x])
+            count = now_count.get(x, 0) + 1
+            now_count[x] = count
+            unique_strs[i] = f"{x}_{count}"
 
     # repeat until all are unique
     #   the algorithm recurses, but will always terminate
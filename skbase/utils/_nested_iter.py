@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # copyright: skbase developers, BSD-3-Clause License (see LICENSE file)
 """Functionality for working with nested sequences."""
-import collections
+from collections.abc import Iterable
 from typing import List
 
 __author__: List[str] = ["RNKuhns", "fkiraly"]
@@ -15,6 +15,29 @@ __all__: List[str] = [
 ]
 
 
+def _is_nested(x):
+    """Check whether x is nested, i.e., an iterable other than a str.
+
+    Exact list and tuple types are decided without the comparatively slow
+    abstract base class check against ``Iterable``, which is only needed for
+    other types.
+
+    Parameters
+    ----------
+    x : Any
+        The object to check.
+
+    Returns
+    -------
+    bool
+        Whether ``x`` is an iterable, but not a str.
+    """
+    type_x = type(x)
+    if type_x is list or type_x is tuple:
+        return True
+    return not isinstance(x, str) and isinstance(x, Iterable)
+
+
 def _remove_single(x):
     """Remove tuple wrapping from singleton.
 
@@ -68,12 +91,22 @@ def flatten(obj):
     >>> flatten([1, 2, [3, (4, 5)], 6])
     [1, 2, 3, 4, 5, 6]
     """
-    if not isinstance(
-        obj, (collections.abc.Iterable, collections.abc.Sequence)
-    ) or isinstance(obj, str):
+    if not _is_nested(obj):
         return [obj]
-    else:
-        return type(obj)([y for x in obj for y in flatten(x)])
+
+    # depth-first traversal with an explicit stack of iterators, rather than
+    # recursion, to avoid one Python call per nested element and recursion limits
+    flat = []
+    stack = [iter(obj)]
+    while stack:
+        for x in stack[-1]:
+            if _is_nested(x):
+                stack.append(iter(x))
+                break
+            flat.append(x)
+        else:
+            stack.pop()
+    return type(obj)(flat)
 
 
 def unflatten(obj, template):
@@ -101,18 +134,43 @@ def unflatten(obj, template):
     >>> unflatten([1, 2, 3, 4, 5, 6], [6, 3, [5, (2, 4)], 1])
     [1, 2, [3, (4, 5)], 6]
     """
-    if not isinstance(template, (list, tuple)):
-        return obj[0]
+    return _unflatten(obj, template, 0)[0]
+
 
-    list_or_tuple = type(template)
-    ls = [unflat_len(x) for x in template]
-    for i in range(1, len(ls)):
-        ls[i] += ls[i - 1]
-    ls = [0] + ls
+def _unflatten(obj, template, i):
+    """Unflatten obj from position i onwards, following the structure of template.
 
-    res = [unflatten(obj[ls[i] : ls[i + 1]], template[i]) for i in range(len(ls) - 1)]
+    Sizes of sub-templates are determined in the same pass that builds the
+    output, so every node of `template` is visited exactly once.
 
-    return list_or_tuple(res)
+    Parameters
+    ----------
+    obj : list or tuple
+        The object to be unflattened.
+    template : nested list/tuple structure
+        The structure to unflatten the elements of `obj` starting at `i` into.
+    i : int
+        Position in `obj` of the first element to place into `template`.
+
+    Returns
+    -------
+    Any
+        Elements of `obj` starting at `i`, with nested list/tuple structure as
+        `template`.
+    int
+        Position in `obj` after the last element placed into `template`.
+    """
+    # leaves that are other iterables, e.g., range or bytes, take up as many
+    # positions of obj as they have (flattened) elements, see unflat_len
+    if not isinstance(template, (list, tuple)):
+        return obj[i], i + unflat_len(template)
+
+    res = []
+    for sub_template in template:
+        node, i = _unflatten(obj, sub_template, i)
+        res.append(node)
+
+    return type(template)(res), i
 
 
 def unflat_len(obj):
@@ -141,12 +199,9 @@ def unflat_len(obj):
     >>> unflat_len([1, (2, 3), 4, 5])
     5
     """
-    if not isinstance(
-        obj, (collections.abc.Iterable, collections.abc.Sequence)
-    ) or isinstance(obj, str):
+    if not _is_nested(obj):
         return 1
-    else:
-        return sum([unflat_len(x) for x in obj])
+    return sum(unflat_len(x) for x in obj)
 
 
 def is_flat(obj):
@@ -172,9 +227,7 @@ def is_flat(obj):
     >>> is_flat([1, (2, 3), 4, 5])
     False
     """
-    elements_flat = (
-        isinstance(x, (collections.abc.Iterable, collections.abc.Sequence))
-        and not isinstance(x, str)
-        for x in obj
-    )
-    return not any(elements_flat)
+    for x in obj:
+        if _is_nested(x):
+            return False
+    return True
@@ -67,25 +67,23 @@ def subset_dict_keys(
     {'some_param__a': 1, 'some_param__b': 2}
     """
 
-    def rem_prefix(x):
-        if not remove_prefix or prefix is None:
-            return x
-        prefix__ = f"{prefix}__"
-        if x.startswith(prefix__):
-            return x[len(prefix__) :]
-        # The way this is used below, this else shouldn't really execute
-        # But its here for completeness in case something goes wrong
-        else:
-            return x  # pragma: no cover
-
     # Handle passage of certain scalar values
     if isinstance(keys, (str, float, int, bool, type)):
         keys = [keys]
 
+    # use a set for constant time membership checks in the comprehensions below
+    # it is built in a single pass, also if keys is a generator
     if prefix is not None:
-        keys = [f"{prefix}__{key}" for key in keys]
+        keys_set = {f"{prefix}__{key}" for key in keys}
+    else:
+        keys_set = set(keys)
+    if remove_prefix and prefix is not None:
+        # all retained keys start with the prefix, so it can be sliced off directly
+        prefix_len = len(f"{prefix}__")
+        subsetted_dict = {
+            k[prefix_len:]: v for k, v in input_dict.items() if k in keys_set
+        }
     else:
-        keys = list(keys)
-    subsetted_dict = {rem_prefix(k): v for k, v in input_dict.items() if k in keys}
+        subsetted_dict = {k: v for k, v in input_dict.items() if k in keys_set}
 
     return subsetted_dict
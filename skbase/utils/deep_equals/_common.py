@@ -22,20 +22,33 @@ def _ret(is_equal, msg="", string_arguments: list = None, return_msg=False):
         if ``is_equal=False``, ``msg`` is formatted with ``string_arguments``
         via ``msg.format(*string_arguments)``
     """
-    if return_msg:
-        if is_equal:
-            msg = ""
-        elif isinstance(string_arguments, (list, tuple)) and len(string_arguments) > 0:
-            msg = msg.format(*string_arguments)
-        return is_equal, msg
-    else:
-        return is_equal
+    ret = _ret_with_msg if return_msg else _ret_is_equal
+    return ret(is_equal, msg, string_arguments)
 
 
-def _make_ret(return_msg):
-    """Curry _ret with return_msg."""
+def _ret_is_equal(is_equal, msg="", string_arguments=None):
+    """Return is_equal only, specialization of _ret for return_msg=False."""
+    return is_equal
+
+
+def _ret_with_msg(is_equal, msg="", string_arguments=None):
+    """Return is_equal and msg, specialization of _ret for return_msg=True."""
+    if is_equal:
+        msg = ""
+    elif string_arguments:
+        msg = msg.format(*string_arguments)
+    return is_equal, msg
 
-    def ret(is_equal, msg, string_arguments=None):
-        return _ret(is_equal, msg, string_arguments, return_msg)
 
-    return ret
+def _make_ret(return_msg):
+    """Return the specialization of _ret for a fixed return_msg.
+
+    The returned function has the signature of ``_ret`` without ``return_msg``,
+    i.e., ``(is_equal, msg="", string_arguments=None)``. It does not branch on
+    ``return_msg``, and does not handle the message at all if
+    ``return_msg=False``. The specializations are defined at module level,
+    so no new function object is created per call.
+    """
+    if return_msg:
+        return _ret_with_msg
+    return _ret_is_equal
@@ -6,6 +6,7 @@ Objects compared can have one of the following valid types:
     pd.Series, pd.DataFrame, np.ndarray
     lists, tuples, or dicts of a valid type (recursive)
 """
+import sys
 from inspect import isclass, signature
 
 from skbase.utils.deep_equals._common import _make_ret
@@ -13,10 +14,14 @@ from skbase.utils.deep_equals._common import _make_ret
 __author__ = ["fkiraly"]
 __all__ = ["deep_equals"]
 
+# builtin types for which == is always a bool, and coincides with equality in value
+_BUILTIN_SCALAR_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
 
 # flag variables for available soft dependencies
 # we are not using _check_soft_dependencies in order to keep
 # this utility uncoupled from the dependency on "packaging", of _check_soft_dependencies
+# results are not cached, so packages installed during a session are picked up
 def _softdep_available(importname):
     from importlib import import_module
 
@@ -73,43 +78,27 @@ def deep_equals(x, y, return_msg=False, plugins=None):
             != - call to generic != returns False
     """
     # call deep_equals_custom with default plugins
-    plugins_default = [
-        _numpy_equals_plugin,
-        _pandas_equals_plugin,
-        _fh_equals_plugin,
-    ]
-
     if plugins is not None:
-        plugins_inner = plugins_default + plugins
+        plugins_inner = _DEFAULT_PLUGINS + tuple(plugins)
     else:
-        plugins_inner = plugins_default
+        plugins_inner = _DEFAULT_PLUGINS
 
     res = deep_equals_custom(x, y, return_msg=return_msg, plugins=plugins_inner)
     return res
 
 
+# x can only be a pandas or numpy object if the package has already been imported,
+# so we look it up in sys.modules, instead of running an import for every object
 def _is_pandas(x):
-    import pandas as pd
+    pd = sys.modules.get("pandas")
 
-    return isinstance(x, (pd.Series, pd.DataFrame, pd.Index))
+    return pd is not None and isinstance(x, (pd.Series, pd.DataFrame, pd.Index))
 
 
 def _is_npndarray(x):
-    import numpy as np
-
-    return isinstance(x, np.ndarray)
-
-
-def _is_npnan(x):
-    numpy_available = _softdep_available("numpy")
-
-    if numpy_available:
-        import numpy as np
-
-        return isinstance(x, float) and np.isnan(x)
+    np = sys.modules.get("numpy")
 
-    else:
-        return False
+    return np is not None and isinstance(x, np.ndarray)
 
 
 def _coerce_list(x):
@@ -123,9 +112,7 @@ def _coerce_list(x):
 
 
 def _numpy_equals_plugin(x, y, return_msg=False, deep_equals=None):
-    numpy_available = _softdep_available("numpy")
-
-    if not numpy_available or not _is_npndarray(x):
+    if not _is_npndarray(x):
         return None
     else:
         import numpy as np
@@ -143,18 +130,22 @@ def _numpy_equals_plugin(x, y, return_msg=False, deep_equals=None):
     elif x.dtype == "object":
         x_flat = x.flatten()
         y_flat = y.flatten()
+        # no np.array_equal shortcut here, as it would not be type strict,
+        # e.g., it considers 1 and 1.0 as equal entries
         for i in range(len(x_flat)):
             is_equal, msg = deep_equals(x_flat[i], y_flat[i], return_msg=True)
-            return ret(is_equal, f"[{i}]" + msg)
-        return ret(True, "")  # catches len(x_flat) == 0
+            if not is_equal:
+                return ret(False, f"[{i}]" + msg)
+        return ret(True, "")
     else:
-        return ret(np.array_equal(x, y, equal_nan=True), ".values")
+        # only float, complex and datetime-like dtypes can hold nan or nat,
+        # for other dtypes equal_nan would only add a redundant pass
+        equal_nan = x.dtype.kind in "fcmM"
+        return ret(np.array_equal(x, y, equal_nan=equal_nan), ".values")
 
 
 def _pandas_equals_plugin(x, y, return_msg=False, deep_equals=None):
-    pandas_available = _softdep_available("pandas")
-
-    if not pandas_available or not _is_pandas(x):
+    if not _is_pandas(x):
         return None
 
     # pandas is a soft dependency, so we compare pandas objects separately
@@ -169,22 +160,31 @@ def _pandas_equals(x, y, return_msg=False, deep_equals=None):
 
     ret = _make_ret(return_msg)
 
+    # identical objects are equal, no need to scan values
+    if x is y:
+        return ret(True, "")
+
     if isinstance(x, pd.Series):
         if x.dtype != y.dtype:
             return ret(False, ".dtype, x.dtype= {} != y.dtype = {}", [x.dtype, y.dtype])
         # if columns are object, recurse over entries and index
         if x.dtype == "object":
-            index_equal = x.index.equals(y.index)
-            values_equal, values_msg = deep_equals(
-                list(x.to_numpy()), list(y.to_numpy()), return_msg=True
-            )
-            if not values_equal:
-                msg = ".values" + values_msg
-            elif not index_equal:
-                msg = f".index, x.index: {x.index}, y.index: {y.index}"
-            else:
-                msg = ""
-            return ret(index_equal and values_equal, msg)
+            # recurse directly over the value arrays, without copying to lists
+            x_values = x.to_numpy()
+            y_values = y.to_numpy()
+            if len(x_values) != len(y_values):
+                return ret(
+                    False,
+                    ".values.len, x.len = {} != y.len = {}",
+                    [len(x_values), len(y_values)],
+                )
+            for i in range(len(x_values)):
+                is_equal, msg = deep_equals(x_values[i], y_values[i], return_msg=True)
+                if not is_equal:
+                    return ret(False, f".values[{i}]" + msg)
+            if not x.index.equals(y.index):
+                return ret(False, f".index, x.index: {x.index}, y.index: {y.index}")
+            return ret(True, "")
         else:
             return ret(x.equals(y), ".series_equals, x = {} != y = {}", [x, y])
     elif isinstance(x, pd.DataFrame):
@@ -241,7 +241,8 @@ def _pandas_equals(x, y, return_msg=False, deep_equals=None):
                         ".index.names, x.index.names = {} != y.index.name = {}",
                         [xix.names, yix.names],
                     )
-                if not np.all(xix.names == yix.names):
+                # names are list-like, so == already returns a bool
+                if not xix.names == yix.names:
                     return ret(
                         False,
                         ".index.names, x.index.names = {} != y.index.name = {}",
@@ -307,15 +308,20 @@ def _tuple_equals(x, y, return_msg=False, deep_equals=None):
     if n != len(y):
         return ret(False, f".len, x.len = {n} != y.len = {len(y)}")
 
-    # we now know dicts are same length
-    for i in range(n):
-        xi = x[i]
-        yi = y[i]
+    # we now know tuples/lists are same length
+    for i, (xi, yi) in enumerate(zip(x, y)):
+        # identical elements are equal, no need to recurse
+        if xi is yi:
+            continue
 
         # recurse through xi/yi
-        is_equal, msg = deep_equals(xi, yi, return_msg=True)
-        if not is_equal:
-            return ret(False, f"[{i}]" + msg)
+        # the message is only requested, and built, if return_msg=True
+        if return_msg:
+            is_equal, msg = deep_equals(xi, yi, return_msg=True)
+            if not is_equal:
+                return ret(False, f"[{i}]" + msg)
+        elif not deep_equals(xi, yi, return_msg=False):
+            return False
 
     return ret(True, "")
 
@@ -347,10 +353,10 @@ def _dict_equals(x, y, return_msg=False, deep_equals=None):
     """
     ret = _make_ret(return_msg)
 
-    xkeys = set(x.keys())
-    ykeys = set(y.keys())
-
-    if xkeys != ykeys:
+    # keys views compare as sets, sets are only built for the message
+    if x.keys() != y.keys():
+        xkeys = set(x.keys())
+        ykeys = set(y.keys())
         xmy = xkeys.difference(ykeys)
         ymx = ykeys.difference(xkeys)
         diffmsg = ".keys,"
@@ -360,15 +366,22 @@ def _dict_equals(x, y, return_msg=False, deep_equals=None):
             diffmsg += f" y.keys-x.keys = {ymx}."
         return ret(False, diffmsg)
 
-    # we now know that xkeys == ykeys
-    for key in xkeys:
-        xi = x[key]
+    # we now know that keys of x and y are equal
+    for key, xi in x.items():
         yi = y[key]
 
+        # identical values are equal, no need to recurse
+        if xi is yi:
+            continue
+
         # recurse through xi/yi
-        is_equal, msg = deep_equals(xi, yi, return_msg=True)
-        if not is_equal:
-            return ret(False, f"[{key}]" + msg)
+        # the message is only requested, and built, if return_msg=True
+        if return_msg:
+            is_equal, msg = deep_equals(xi, yi, return_msg=True)
+            if not is_equal:
+                return ret(False, f"[{key}]" + msg)
+        elif not deep_equals(xi, yi, return_msg=False):
+            return False
 
     return ret(True, "")
 
@@ -411,6 +424,14 @@ def _fh_equals_plugin(x, y, return_msg=False, deep_equals=None):
     return ret(True, "")
 
 
+# default plugins used by deep_equals
+_DEFAULT_PLUGINS = (_numpy_equals_plugin, _pandas_equals_plugin, _fh_equals_plugin)
+
+
+# equality functions for builtin container types, by exact type
+_CONTAINER_EQUALS = {list: _tuple_equals, tuple: _tuple_equals, dict: _dict_equals}
+
+
 def deep_equals_custom(x, y, return_msg=False, plugins=None):
     """Test two objects for equality in value.
 
@@ -440,6 +461,53 @@ def deep_equals_custom(x, y, return_msg=False, plugins=None):
         Plugins can have an additional argument ``deep_equals=None``
         by which the parent function to be called recursively is passed
 
+    Returns
+    -------
+    is_equal: bool - True if x and y are equal in value
+        x and y do not need to be equal in reference
+    msg : str, only returned if return_msg = True
+        indication of what is the reason for not being equal
+    """
+    if plugins is None:
+        plugins = []
+
+    # check once if plugins have deep_equals argument, rather than for every
+    # object visited in the recursion, as inspecting the signature is expensive
+    # if so, the recursion function is passed as argument to the plugin
+    # this allows for recursive calls to deep_equals
+    plugins = [
+        (plugin, "deep_equals" in signature(plugin).parameters) for plugin in plugins
+    ]
+
+    # we need to pass in the same plugins, so we curry
+    # the curried function is created once, and reused throughout the recursion
+    def deep_equals_curried(x, y, return_msg=False):
+        return _deep_equals_custom(
+            x,
+            y,
+            return_msg=return_msg,
+            plugins=plugins,
+            deep_equals=deep_equals_curried,
+        )
+
+    return deep_equals_curried(x, y, return_msg=return_msg)
+
+
+def _deep_equals_custom(x, y, return_msg, plugins, deep_equals):
+    """Test two objects for equality in value, recursion step of deep_equals_custom.
+
+    Parameters
+    ----------
+    x : object
+    y : object
+    return_msg : bool
+        whether to return informative message about what is not equal
+    plugins : list of tuples (plugin, bool)
+        plugins as in ``deep_equals_custom``, paired with whether the plugin
+        has a ``deep_equals`` argument
+    deep_equals : callable
+        function to call for recursion, with signature ``(x, y, return_msg)``
+
     Returns
     -------
     is_equal: bool - True if x and y are equal in value
@@ -449,59 +517,65 @@ def deep_equals_custom(x, y, return_msg=False, plugins=None):
     """
     ret = _make_ret(return_msg)
 
-    if type(x) is not type(y):
-        return ret(False, f".type, x.type = {type(x)} != y.type = {type(y)}")
+    # identical objects are equal, no need to traverse them
+    if x is y:
+        return ret(True, "")
+
+    type_x = type(x)
+
+    if type_x is not type(y):
+        return ret(False, f".type, x.type = {type_x} != y.type = {type(y)}")
 
     # we now know all types are the same
     # so now we compare values
 
-    # we need to pass in the same plugins, so we curry
-    def deep_equals_curried(x, y, return_msg=False):
-        return deep_equals_custom(x, y, return_msg=return_msg, plugins=plugins)
+    # fast path for equal builtin scalars, which need no plugins or recursion
+    # unequal scalars are passed on, to produce the same message as below
+    if type_x in _BUILTIN_SCALAR_TYPES and x == y:
+        return ret(True, "")
 
     # recursion through lists, tuples and dicts
-    if isinstance(x, (list, tuple)):
-        dec = deep_equals_curried
-        return ret(*_tuple_equals(x, y, return_msg=True, deep_equals=dec))
+    # exact types are dispatched by lookup, subclasses by the isinstance checks below
+    container_equals = _CONTAINER_EQUALS.get(type_x)
+    if container_equals is not None:
+        return container_equals(x, y, return_msg=return_msg, deep_equals=deep_equals)
+    elif isinstance(x, (list, tuple)):
+        return _tuple_equals(x, y, return_msg=return_msg, deep_equals=deep_equals)
     elif isinstance(x, dict):
-        dec = deep_equals_curried
-        return ret(*_dict_equals(x, y, return_msg=True, deep_equals=dec))
-    elif _is_npnan(x):
-        return ret(_is_npnan(y), f"type(x)={type(x)} != type(y)={type(y)}")
+        return _dict_equals(x, y, return_msg=return_msg, deep_equals=deep_equals)
+    # nan is the only float not equal to itself, this also covers np.float64,
+    # which is a subclass of float, and does not require numpy
+    # y is also a float at this point, as types are equal
+    elif isinstance(x, float) and x != x:
+        return ret(y != y, f"type(x)={type(x)} != type(y)={type(y)}")
     elif isclass(x):
         return ret(x == y, f".class, x={x.__name__} != y={y.__name__}")
 
-    if plugins is not None:
-        for plugin in plugins:
-            # check if plugin has deep_equals argument
-            # if so, pass this function as argument to plugin
-            # this allows for recursive calls to deep_equals
-
-            # get the signature of the plugin
-            sig = signature(plugin)
-            # check if deep_equals is an argument of the plugin
-            if "deep_equals" in sig.parameters:
-                kwargs = {"deep_equals": deep_equals_curried}
-            else:
-                kwargs = {}
-
-            res = plugin(x, y, return_msg=return_msg, **kwargs)
+    for plugin, has_deep_equals_arg in plugins:
+        if has_deep_equals_arg:
+            res = plugin(x, y, return_msg=return_msg, deep_equals=deep_equals)
+        else:
+            res = plugin(x, y, return_msg=return_msg)
 
-            # if plugin does not apply, res is None
-            if res is not None:
-                return res
+        # if plugin does not apply, res is None
+        if res is not None:
+            return res
 
     # if the object x and y have a len() then compare of x and y lengths else continue
-    if _safe_len(x) != _safe_len(y):
-        return ret(
-            False,
-            f".len, x.len = {len(x)} != y.len = {len(y)}",
-        )
+    # lengths are computed once, and reused in the message
+    x_len = _safe_len(x)
+    y_len = _safe_len(y)
+    if x_len != y_len:
+        return ret(False, f".len, x.len = {x_len} != y.len = {y_len}")
 
     # this if covers case where != is boolean
     # some types return a vector upon !=, this is covered in the next elif
-    if isinstance(x == y, bool):
-        return ret(x == y, f" !=, {x} != {y}")
+    # the message is formatted lazily, as it is not needed if x == y,
+    # and the string representation of x and y may be expensive to compute
+    # x == y is evaluated only once, as it may be expensive
+    is_equal = x == y
+    if isinstance(is_equal, bool):
+        return ret(is_equal, " !=, {} != {}", [x, y])
 
     # deal with the case where != returns a vector
     if _safe_any_unequal(x, y):
@@ -538,7 +612,7 @@ def _safe_any_unequal(x, y):
     import numpy as np
 
     try:
-        any_un = np.any(x != y) or np.any(_coerce_list(x != y))
+        any_un = np.any(unequal) or np.any(_coerce_list(unequal))
         if isinstance(any_un, bool) or any_un.dtype == "bool":
             return any_un
         else:
@@ -551,8 +625,7 @@ def _safe_len(x):
     """Return length of x if len(x) does not result in exception, else -1."""
     if hasattr(x, "__len__"):
         try:
-            x_len = len(x)
-            return x_len
+            return len(x)
         except Exception:
             return -1
     return -1
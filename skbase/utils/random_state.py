@@ -3,6 +3,9 @@
 
 __author__ = ["fkiraly"]
 
+import hashlib
+import numbers
+
 
 def set_random_state(estimator, random_state=None, deep=True, root_policy="copy"):
     """Set random_state pseudo-random seed parameters for an estimator.
@@ -50,12 +53,15 @@ def set_random_state(estimator, random_state=None, deep=True, root_policy="copy"
     random_state_orig = random_state
     random_state = check_random_state(random_state)
 
-    keys = []
-    for key in sorted(estimator.get_params(deep=True)):
-        if key == "random_state" and root_policy != "keep":
-            keys.append(key)
-        if key.endswith("__random_state") and deep:
-            keys.append(key)
+    # nested random_state parameters are only needed if deep=True
+    # if deep=False, the shallow parameters suffice, avoiding traversal of components
+    params = estimator.get_params(deep=deep)
+    keys = [
+        key
+        for key in sorted(params)
+        if (key == "random_state" and root_policy != "keep")
+        or (deep and key.endswith("__random_state"))
+    ]
 
     seeds = sample_dependent_seed(random_state, n_seeds=len(keys))
     to_set = dict(zip(keys, seeds))
@@ -79,8 +85,7 @@ def check_random_state(seed):
         If seed is already a RandomState instance, return it.
         Otherwise raise ValueError.
     """
-    import numbers
-
+    # numpy is a soft dependency, so it is imported only when needed
     import numpy as np
 
     if seed is None or seed is np.random:
@@ -117,24 +122,17 @@ def sample_dependent_seed(seed, n_seeds=None):
         int if ``n_seeds`` is None, otherwise list of ints.
         The sampled seed(s).
     """
-    if n_seeds is not None:
-        seeds = []
-        for _ in range(n_seeds):
-            new_seed = sample_dependent_seed(seed)
-            seeds.append(new_seed)
-            seed = new_seed
-        return seeds
-
-    import hashlib
-
-    # Convert the base seed to bytes
-    seed_bytes = str(seed).encode("utf-8")
-
-    # Use a cryptographic hash function (SHA-256) to generate a secure hash
-    hash_object = hashlib.sha256(seed_bytes)
-    hashed_seed = hash_object.hexdigest()
-
-    # Convert the hashed seed to an integer
-    new_seed = int(hashed_seed, 16)
-
-    return new_seed
+    # seeds are chained iteratively, each seed is the hash of the previous one
+    seeds = []
+    for _ in range(1 if n_seeds is None else n_seeds):
+        # Convert the previous seed to bytes
+        seed_bytes = str(seed).encode("utf-8")
+
+        # Use a cryptographic hash function (SHA-256) to generate a secure hash,
+        # and convert the hashed seed to an integer
+        seed = int.from_bytes(hashlib.sha256(seed_bytes).digest(), "big")
+        seeds.append(seed)
+
+    if n_seeds is None:
+        return seeds[0]
+    return seeds
@@ -7,38 +7,46 @@ import io
 import sys
 
 
-class StdoutMute:
-    """A context manager to suppress stdout.
+class _NullSink(io.TextIOBase):
+    """Text stream that discards all output written to it."""
+
+    def write(self, s):
+        """Discard s, and return its length, as a text stream would."""
+        return len(s)
 
-    Exception handling on exit can be customized by overriding
-    the ``_handle_exit_exceptions`` method.
+
+class _StreamMute:
+    """A context manager to suppress a stream of sys, shared logic of mutes.
+
+    Concrete mutes set ``_stream_name`` to the name of the attribute of ``sys``
+    holding the stream to suppress, e.g., ``"stdout"`` or ``"stderr"``.
 
     Parameters
     ----------
     active : bool, default=True
-        Whether to suppress stdout or not.
-        If True, stdout is suppressed.
-        If False, stdout is not suppressed, and the context manager does nothing
-        except catch and suppress ModuleNotFoundError.
+        Whether to suppress the stream or not.
     """
 
+    _stream_name = None
+
     def __init__(self, active=True):
         self.active = active
 
     def __enter__(self):
         """Context manager entry point."""
-        # capture stdout if active
-        # store the original stdout so it can be restored in __exit__
+        # capture the stream if active
+        # store the original stream so it can be restored in __exit__
+        # output is discarded rather than kept in memory or written to a file
         if self.active:
-            self._stdout = sys.stdout
-            sys.stdout = io.StringIO()
+            self._original_stream = getattr(sys, self._stream_name)
+            setattr(sys, self._stream_name, _NullSink())
 
     def __exit__(self, type, value, traceback):  # noqa: A002
         """Context manager exit point."""
-        # restore stdout if active
-        # if not active, nothing needs to be done, since stdout was not replaced
+        # restore the stream if active
+        # if not active, nothing needs to be done, since the stream was not replaced
         if self.active:
-            sys.stdout = self._stdout
+            setattr(sys, self._stream_name, self._original_stream)
 
         if type is not None:
             return self._handle_exit_exceptions(type, value, traceback)
@@ -62,3 +70,21 @@ class StdoutMute:
         """
         # by default, all exceptions are raised
         return False
+
+
+class StdoutMute(_StreamMute):
+    """A context manager to suppress stdout.
+
+    Exception handling on exit can be customized by overriding
+    the ``_handle_exit_exceptions`` method.
+
+    Parameters
+    ----------
+    active : bool, default=True
+        Whether to suppress stdout or not.
+        If True, stdout is suppressed.
+        If False, stdout is not suppressed, and the context manager does nothing
+        except catch and suppress ModuleNotFoundError.
+    """
+
+    _stream_name = "stdout"
@@ -7,6 +7,8 @@ tests in this module include:
 
 - test_is_scalar_nan_output to verify _is_scalar_nan outputs expected value for
   different inputs.
+- test_is_scalar_nan_no_comparison to verify _is_scalar_nan does not compare
+  non-scalar inputs elementwise.
 """
 from skbase.utils._check import _is_scalar_nan
 
@@ -22,3 +24,26 @@ def test_is_scalar_nan_output():
     assert _is_scalar_nan(None) is False
     assert _is_scalar_nan("") is False
     assert _is_scalar_nan([np.nan]) is False
+
+
+def test_is_scalar_nan_no_comparison():
+    """Test that _is_scalar_nan does not compare non-scalar inputs elementwise."""
+    import numpy as np
+    import pandas as pd
+
+    calls = []
+
+    class _CountCompare:
+        def __eq__(self, other):
+            calls.append(other)
+            return True
+
+        def __ne__(self, other):
+            calls.append(other)
+            return False
+
+    arr = np.array([_CountCompare(), _CountCompare()], dtype=object)
+    assert _is_scalar_nan(arr) is False
+    assert _is_scalar_nan(pd.DataFrame({"a": arr})) is False
+    assert _is_scalar_nan(_CountCompare()) is False
+    assert not calls
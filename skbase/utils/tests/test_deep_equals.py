@@ -7,6 +7,13 @@ import pytest
 from skbase.utils.deep_equals import deep_equals
 from skbase.utils.dependencies import _check_soft_dependencies
 
+# soft dependency checks are done once, at module level
+SKLEARN_AVAILABLE = _check_soft_dependencies("scikit-learn", severity="none")
+
+# types whose own copy method is a full copy, unless they have object dtype
+# populated below, depending on soft dependencies
+FAST_COPY_TYPES = ()
+
 # examples used for comparison below
 EXAMPLES = [
     42,
@@ -20,6 +27,8 @@ EXAMPLES = [
 if _check_soft_dependencies("numpy", severity="none"):
     import numpy as np
 
+    FAST_COPY_TYPES += (np.ndarray,)
+
     EXAMPLES += [
         np.array([2, 3, 4]),
         np.array([2, 4, 5]),
@@ -33,6 +42,8 @@ if _check_soft_dependencies("numpy", severity="none"):
         np.array([0.1, 1], dtype="object"),
         np.array([0.2, 1], dtype="object"),
         np.array([0.2, 1, 4], dtype="object"),
+        # object arrays differing only after the first entry
+        np.array([0.1, 2], dtype="object"),
     ]
 
     # test cases with nested numpy arrays
@@ -45,6 +56,8 @@ if _check_soft_dependencies("numpy", severity="none"):
 if _check_soft_dependencies("pandas", severity="none"):
     import pandas as pd
 
+    FAST_COPY_TYPES += (pd.DataFrame, pd.Series, pd.Index)
+
     EXAMPLES += [
         pd.DataFrame({"a": [4, 2]}),
         pd.DataFrame({"a": [4, 3]}),
@@ -71,7 +84,8 @@ if _check_soft_dependencies("pandas", severity="none"):
 
     EXAMPLES += [X]
 
-if _check_soft_dependencies("scikit-learn", severity="none"):
+if SKLEARN_AVAILABLE:
+    from sklearn.base import BaseEstimator, clone
     from sklearn.ensemble import RandomForestRegressor
 
     EXAMPLES += [RandomForestRegressor()]
@@ -81,8 +95,15 @@ if _check_soft_dependencies("scikit-learn", severity="none"):
 @pytest.mark.parametrize("fixture", EXAMPLES)
 def test_deep_equals_positive(fixture):
     """Tests that deep_equals correctly identifies equal objects as equal."""
-    x = copy_except_if_sklearn(fixture)
-    y = copy_except_if_sklearn(fixture)
+    if SKLEARN_AVAILABLE and isinstance(fixture, BaseEstimator):
+        # sklearn estimators do not implement __eq__, so distinct instances are
+        # unequal, and comparing an instance with itself would only hit the
+        # identity short-circuit, hence we compare the parameters of a clone
+        x = fixture.get_params()
+        y = clone(fixture).get_params()
+    else:
+        x = copy_except_if_sklearn(fixture)
+        y = copy_except_if_sklearn(fixture)
 
     msg = (
         f"deep_equals incorrectly returned False for two identical copies of "
@@ -92,22 +113,34 @@ def test_deep_equals_positive(fixture):
 
 
 n = len(EXAMPLES)
-DIFFERENT_PAIRS = [
-    (EXAMPLES[i], EXAMPLES[j]) for i in range(n) for j in range(n) if i != j
-]
 
 
-@pytest.mark.parametrize("fixture1,fixture2", DIFFERENT_PAIRS)
-def test_deep_equals_negative(fixture1, fixture2):
+@pytest.fixture(scope="module")
+def example_copies():
+    """Copies of EXAMPLES, made once per module and shared between tests.
+
+    deep_equals does not mutate its arguments, so the copies can be reused.
+    """
+    return [copy_except_if_sklearn(example) for example in EXAMPLES]
+
+
+# parametrized over the first object only, and looping over the second,
+# to avoid collecting a test instance for each of the n * (n - 1) pairs
+@pytest.mark.parametrize("i", range(n))
+def test_deep_equals_negative(i, example_copies):
     """Tests that deep_equals correctly identifies unequal objects as unequal."""
-    x = copy_except_if_sklearn(fixture1)
-    y = copy_except_if_sklearn(fixture2)
+    x = copy_except_if_sklearn(EXAMPLES[i])
 
-    msg = (
-        f"deep_equals incorrectly returned True when comparing "
-        f"the following, different objects: x={x}, y={y}"
-    )
-    assert not deep_equals(x, y), msg
+    for j in range(n):
+        if i == j:
+            continue
+        y = example_copies[j]
+
+        msg = (
+            f"deep_equals incorrectly returned True when comparing "
+            f"the following, different objects: x={x}, y={y}"
+        )
+        assert not deep_equals(x, y), msg
 
 
 def copy_except_if_sklearn(obj):
@@ -118,12 +151,18 @@ def copy_except_if_sklearn(obj):
 
     This is the current status quo, possibly we want to change this in the future.
     """
-    if not _check_soft_dependencies("scikit-learn", severity="none"):
-        return deepcopy(obj)
+    if SKLEARN_AVAILABLE and isinstance(obj, BaseEstimator):
+        return obj
+    # arrays and pandas objects without object dtype do not reference other
+    # objects, so their own copy is a full copy, and faster than deepcopy
+    elif isinstance(obj, FAST_COPY_TYPES) and not _has_object_dtype(obj):
+        return obj.copy()
     else:
-        from sklearn.base import BaseEstimator
+        return deepcopy(obj)
+
 
-        if isinstance(obj, BaseEstimator):
-            return obj
-        else:
-            return deepcopy(obj)
+def _has_object_dtype(obj):
+    """Check whether a numpy or pandas object has object dtype entries."""
+    if hasattr(obj, "dtypes") and not hasattr(obj, "dtype"):
+        return any(dtype == "object" for dtype in obj.dtypes)
+    return obj.dtype == "object"
@@ -115,6 +115,8 @@ def test_make_strings_unique_output():
     # Case where some strings repeated
     some_strs = ["abc", "abc", "bcd"]
     assert make_strings_unique(some_strs) == ["abc_1", "abc_2", "bcd"]
+    # Verify the input list is not mutated
+    assert some_strs == ["abc", "abc", "bcd"]
     # Case when input is tuple
     assert make_strings_unique(tuple(some_strs)) == ("abc_1", "abc_2", "bcd")
 
@@ -52,6 +52,12 @@ def test_flatten():
         BaseEstimator(),
     )
 
+    # Verify nesting deeper than the recursion limit can be flattened
+    deeply_nested = [1]
+    for _ in range(5000):
+        deeply_nested = [deeply_nested, 2]
+    assert flatten(deeply_nested) == [1] + [2] * 5000
+
 
 def test_unflatten():
     """Test output of unflatten."""
@@ -62,6 +68,17 @@ def test_unflatten():
         6,
     ]
 
+    # leaves that are non-list/tuple iterables take up positions per element
+    assert unflatten(["a", 1, 2, "c"], ["a", b"xy", "c"]) == ["a", 1, "c"]
+    assert unflatten([1, 2, 3, 4, 5], [[1, 2], range(2), 5]) == [[1, 2], 3, 5]
+
+    # positions stay aligned after such leaves, as each advances by its
+    # length in the flattened sequence, i.e., len(flatten(t)) == unflat_len(t)
+    template = [1, [range(2), (3, b"xy")], {4, 5}, "s"]
+    flat = flatten(template)
+    assert unflatten(flat, template) == [1, [0, (3, 120)], 4, "s"]
+    assert len(flat) == unflat_len(template)
+
 
 def test_unflat_len():
     """Test output of unflat_len."""
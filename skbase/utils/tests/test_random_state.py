@@ -22,6 +22,21 @@ def test_sample_dependent_seed(seed, n_seeds):
         assert all(isinstance(s, int) for s in seeds)
 
 
+def test_sample_dependent_seed_chain():
+    """Test sample_dependent_seed with n_seeds chains single seeds, reproducibly."""
+    seeds = sample_dependent_seed(seed=42, n_seeds=3)
+
+    assert seeds[0] == sample_dependent_seed(seed=42)
+    assert seeds[1] == sample_dependent_seed(seed=seeds[0])
+    assert seeds[2] == sample_dependent_seed(seed=seeds[1])
+
+    # seeds must be stable across versions, for reproducibility
+    expected_first = (
+        52142063543217935108392605932536905068334213121597159393376024684286053089353
+    )
+    assert seeds[0] == expected_first
+
+
 @pytest.mark.parametrize("deep", [True, False])
 @pytest.mark.parametrize("external", [True, False])
 @pytest.mark.parametrize("root_policy", ["copy", "new", "keep"])